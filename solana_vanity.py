@@ -1,25 +1,509 @@
 from solders.keypair import Keypair # type: ignore
 import base58
+import argparse
+import csv
 import time
 import json
+import functools
+import getpass
+import hashlib
+import hmac
+import math
 import os
 import sys
 import queue
+import signal
+import threading
 import multiprocessing as mp
+from collections import deque
 from datetime import timedelta
-import statistics
 import psutil
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple
 from multiprocessing.queues import Queue
 from multiprocessing.synchronize import Event
 
+def geometric_quantile(probability: float, percentile: float) -> float:
+    """Attempts needed to have found a match with the given confidence"""
+    if probability <= 0:
+        return float('inf')
+    if probability >= 1 or percentile <= 0:
+        return 1.0
+    if percentile >= 1:
+        return float('inf')
+    return math.log1p(-percentile) / math.log1p(-probability)
+
+def check_budget(max_seconds: float = None, max_attempts: int = None) -> None:
+    """Raise ValueError unless every given limit is a positive, finite number"""
+    if max_seconds is not None and not (math.isfinite(max_seconds) and max_seconds > 0):
+        raise ValueError("time limit must be a positive, finite number")
+    if max_attempts is not None and max_attempts <= 0:
+        raise ValueError("attempt limit must be positive")
+
+def success_probability(probability: float, attempts: float) -> float:
+    """Chance that at least one of `attempts` independent tries matches"""
+    if probability <= 0 or attempts <= 0:
+        return 0.0
+    if probability >= 1:
+        return 1.0
+    return -math.expm1(attempts * math.log1p(-probability))
+
+def format_duration(seconds: float) -> str:
+    if seconds == float('inf'):
+        return "never"
+    if seconds > 1000 * 365 * 86400:
+        return "> 1000 years"
+    return str(timedelta(seconds=int(seconds)))
+
+class RollingStats:
+    """Bounded window of speed samples with O(1), thread-safe summaries"""
+    def __init__(self, window: int = 10):
+        self.window = max(1, window)
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=self.window)
+        self._window_sum = 0.0
+        self._count = 0
+        self._total = 0.0
+
+    def __getstate__(self):
+        # Locks can't be pickled, which matters when workers are spawned
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, value: float) -> None:
+        with self._lock:
+            if len(self._samples) == self.window:
+                self._window_sum -= self._samples[0]
+            self._samples.append(value)
+            self._window_sum += value
+            self._count += 1
+            self._total += value
+            # Re-sum once per window so float drift in the running sum can't accumulate
+            if self._count % self.window == 0:
+                self._window_sum = math.fsum(self._samples)
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return self._count
+
+    @property
+    def total(self) -> float:
+        with self._lock:
+            return self._total
+
+    @property
+    def recent_rate(self) -> float:
+        """Mean of the samples still inside the window"""
+        with self._lock:
+            return self._window_sum / len(self._samples) if self._samples else 0.0
+
+    @property
+    def average_rate(self) -> float:
+        with self._lock:
+            return self._total / self._count if self._count else 0.0
+
+    def eta(self, probability: float, percentile: float = 0.5, workers: int = 1) -> float:
+        """Seconds until a match is found with the given confidence at the recent rate"""
+        speed = self.recent_rate * workers
+        if speed <= 0:
+            return float('inf')
+        return geometric_quantile(probability, percentile) / speed
+
+BASE58_CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+def base58_matches(char: str, case_sensitive: bool = True) -> int:
+    """How many Base58 digits a pattern character accepts"""
+    if case_sensitive:
+        return 1 if char in BASE58_CHARS else 0
+    return sum(1 for c in BASE58_CHARS if c.lower() == char.lower())
+
+SHARD_WORKER_BITS = 16  # Shard ids are (node_id << 16) | worker_id
+
+def shard_id(node_id: int, worker_id: int) -> int:
+    return (node_id << SHARD_WORKER_BITS) | worker_id
+
+def derive_shard_key(master_seed: bytes, shard: int) -> bytes:
+    """Independent 32-byte key for one shard of a job (HMAC-SHA256 as the KDF)"""
+    return hmac.new(master_seed, b"sol-vanity/shard/" + shard.to_bytes(8, 'big'), hashlib.sha256).digest()
+
+def shard_seed(shard_key: bytes, counter: int) -> bytes:
+    """Keypair seed number `counter` of a shard's keystream"""
+    return hashlib.blake2b(counter.to_bytes(8, 'big'), key=shard_key, digest_size=32).digest()
+
+def derive_keypair(master_seed: bytes, shard: int, counter: int) -> Keypair:
+    """Rebuild the keypair tried at (shard, counter), e.g. to audit a reported match"""
+    return Keypair.from_seed(shard_seed(derive_shard_key(master_seed, shard), counter))
+
+class GenerationProgress(NamedTuple):
+    total_attempts: int
+    worker_rates: Dict[int, float]
+    total_rate: float
+    elapsed: float
+    paused: bool
+    match_probability: float
+    expected_attempts: float
+    eta_seconds: float
+    live_workers: int = 0
+    expected_workers: int = 0
+    restarts: int = 0
+    budget_attempts_left: float = float('inf')  # Attempts the remaining budget allows at the current rate
+    success_within_budget: float = None  # Chance of a match before the budget runs out, if there is one
+    eta_p50: float = float('inf')  # Seconds until a match is 50% likely at the recent rate
+    eta_p90: float = float('inf')
+
+    @property
+    def degraded(self) -> bool:
+        return self.live_workers < self.expected_workers
+
+class WorkerRestart(NamedTuple):
+    worker_id: int
+    reason: str
+    time: float
+
+class WorkerSupervisor:
+    """Keeps the worker pool at full strength, restarting dead or silent workers
+
+    A worker slot is given up on once it needs more than max_restarts restarts
+    within restart_window seconds, so a crash loop ends quickly while rare
+    failures on a long run are always replaced.
+    """
+    def __init__(self, spawn: Callable[[int], mp.Process], num_workers: int,
+                 heartbeat_timeout: float = 15.0, max_restarts: int = 5,
+                 restart_window: float = 600.0, on_exit: Callable[[int], None] = None):
+        self.spawn = spawn
+        self.on_exit = on_exit  # Called with the worker id once a failed worker has been reaped
+        self.num_workers = num_workers
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.processes: Dict[int, mp.Process] = {}
+        self.heartbeats: Dict[int, float] = {}
+        self.errors: Dict[int, str] = {}
+        self.restart_times: Dict[int, deque] = {}
+        self.restarts: List[WorkerRestart] = []
+        self.abandoned = set()
+
+    def start(self) -> None:
+        for worker_id in range(self.num_workers):
+            self._start_worker(worker_id)
+
+    def _start_worker(self, worker_id: int) -> None:
+        self.processes[worker_id] = self.spawn(worker_id)
+        self.heartbeats[worker_id] = time.time()
+
+    def heartbeat(self, worker_id: int) -> None:
+        self.heartbeats[worker_id] = time.time()
+
+    def report_error(self, worker_id: int, reason: str, pid: int = None) -> None:
+        # A report that arrives after its process was reaped mustn't stick to the replacement
+        p = self.processes.get(worker_id)
+        if p is not None and (pid is None or p.pid == pid):
+            self.errors[worker_id] = reason
+
+    @staticmethod
+    def _exit_reason(exitcode: int) -> str:
+        if exitcode is not None and exitcode < 0:
+            try:
+                return f"killed by {signal.Signals(-exitcode).name}"
+            except ValueError:
+                return f"killed by signal {-exitcode}"
+        return f"exited with code {exitcode}"
+
+    def check(self, paused: bool = False) -> List[WorkerRestart]:
+        """Restart dead or hung workers; returns the restarts made by this call"""
+        now = time.time()
+        restarted = []
+        for worker_id, p in list(self.processes.items()):
+            if p.is_alive():
+                if paused:
+                    # Paused workers don't report, so don't hold the silence against them
+                    self.heartbeats[worker_id] = now
+                    continue
+                silent_for = now - self.heartbeats[worker_id]
+                if silent_for < self.heartbeat_timeout:
+                    continue
+                reason = f"no heartbeat for {silent_for:.0f}s"
+                p.terminate()
+            elif p.exitcode == 0 and worker_id not in self.errors:
+                continue  # Finished cleanly after reporting a match
+            else:
+                reason = self.errors.pop(worker_id, None) or self._exit_reason(p.exitcode)
+            self._reap(p)
+            del self.processes[worker_id]
+            if self.on_exit:
+                self.on_exit(worker_id)
+            
+            recent = self.restart_times.setdefault(worker_id, deque())
+            while recent and now - recent[0] > self.restart_window:
+                recent.popleft()
+            if len(recent) >= self.max_restarts:
+                self.abandoned.add(worker_id)
+                restarted.append(WorkerRestart(
+                    worker_id, f"{reason}; giving up after {len(recent)} restarts "
+                               f"in {timedelta(seconds=int(now - recent[0]))}", now))
+                continue
+            recent.append(now)
+            self._start_worker(worker_id)
+            restart = WorkerRestart(worker_id, reason, now)
+            self.restarts.append(restart)
+            restarted.append(restart)
+        return restarted
+
+    @property
+    def live_workers(self) -> int:
+        return sum(1 for p in self.processes.values() if p.is_alive())
+
+    @property
+    def all_failed(self) -> bool:
+        """Every slot has been given up on, so nothing is left searching"""
+        return len(self.abandoned) >= self.num_workers
+
+    @staticmethod
+    def _reap(p: mp.Process, timeout: float = 1.0) -> None:
+        """Join a terminated worker, killing it if it ignores SIGTERM (e.g. while stopped)"""
+        p.join(timeout)
+        if p.is_alive():
+            p.kill()
+            p.join(timeout)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        for p in self.processes.values():
+            p.terminate()
+        deadline = time.time() + timeout
+        for p in self.processes.values():
+            p.join(max(0.0, deadline - time.time()))
+        for p in self.processes.values():
+            if p.is_alive():
+                p.kill()
+                p.join(timeout)
+
+PROFILE_STAGES = ("entropy", "derivation", "encoding", "matching", "control", "queue", "pause")
+STAGE_ENTROPY, STAGE_DERIVATION, STAGE_ENCODING, STAGE_MATCHING, STAGE_CONTROL, STAGE_QUEUE, STAGE_PAUSE = range(len(PROFILE_STAGES))
+
+def _profile_add(data, base: int, stage: int, elapsed_ns: int) -> None:
+    # Each worker owns its own slots, so no lock is needed
+    data[base + stage * 2] += elapsed_ns
+    data[base + stage * 2 + 1] += 1
+
+class StageProfiler:
+    """Per-worker stage timings aggregated in shared memory, exported as JSON and a trace"""
+    def __init__(self, num_workers: int, sample_rate: float, path: str):
+        self.num_workers = num_workers
+        self.sample_rate = sample_rate
+        self.path = path
+        self.trace_path = os.path.splitext(path)[0] + ".trace.json"
+        # [sum_ns, count] per stage per worker
+        self.data = mp.Array('d', num_workers * len(PROFILE_STAGES) * 2, lock=False)
+        self.start_time = time.time()
+        self._last = None
+        self._trace_started = False
+
+    @staticmethod
+    def worker_base(worker_id: int) -> int:
+        return worker_id * len(PROFILE_STAGES) * 2
+
+    def snapshot(self) -> Dict[int, Dict[str, Tuple[float, int]]]:
+        values = self.data[:]
+        snapshot = {}
+        for worker_id in range(self.num_workers):
+            base = self.worker_base(worker_id)
+            snapshot[worker_id] = {stage: (values[base + i * 2], int(values[base + i * 2 + 1]))
+                                   for i, stage in enumerate(PROFILE_STAGES)}
+        return snapshot
+
+    @staticmethod
+    def _summary(total_ns: float, count: int) -> dict:
+        return {"samples": count, "total_ms": total_ns / 1e6,
+                "mean_us": total_ns / count / 1e3 if count else 0.0}
+
+    def export(self) -> None:
+        """Rewrite the JSON report and append counter events to the trace"""
+        now = time.time()
+        snapshot = self.snapshot()
+        totals = {stage: [0.0, 0] for stage in PROFILE_STAGES}
+        workers = {}
+        for worker_id, stages in snapshot.items():
+            workers[str(worker_id)] = {stage: self._summary(*stages[stage]) for stage in PROFILE_STAGES}
+            for stage in PROFILE_STAGES:
+                totals[stage][0] += stages[stage][0]
+                totals[stage][1] += stages[stage][1]
+        report = {
+            "generated_at": now,
+            "elapsed": now - self.start_time,
+            "sample_rate": self.sample_rate,
+            "totals": {stage: self._summary(*totals[stage]) for stage in PROFILE_STAGES},
+            "workers": workers,
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, self.path)
+        
+        # Trace Event Format; the closing bracket is optional, so events can just be appended
+        events = []
+        if not self._trace_started:
+            events.extend({"name": "process_name", "ph": "M", "pid": worker_id + 1,
+                           "args": {"name": f"worker {worker_id}"}} for worker_id in snapshot)
+        ts = (now - self.start_time) * 1e6
+        for worker_id, stages in snapshot.items():
+            previous = self._last[worker_id] if self._last else {}
+            interval = {}
+            for stage, (total_ns, count) in stages.items():
+                last_ns, last_count = previous.get(stage, (0.0, 0))
+                if count > last_count:
+                    interval[stage] = (total_ns - last_ns) / (count - last_count) / 1e3
+            if interval:
+                events.append({"name": "stage mean (us)", "ph": "C", "ts": ts,
+                               "pid": worker_id + 1, "args": interval})
+        with open(self.trace_path, 'a' if self._trace_started else 'w') as f:
+            if not self._trace_started:
+                f.write("[\n")
+            for event in events:
+                f.write(json.dumps(event) + ",\n")
+        self._trace_started = True
+        self._last = snapshot
+
 class VanityAddressGenerator:
-    def __init__(self, prefix: str = "", suffix: str = "", case_sensitive: bool = True):
+    def __init__(self, prefix: str = "", suffix: str = "", case_sensitive: bool = True,
+                 profile_rate: float = 0.0, profile_path: str = None, profile_interval: float = 10.0,
+                 master_seed: bytes = None, node_id: int = 0,
+                 counter_start: int = 0):
         self.prefix = prefix
         self.suffix = suffix
         self.case_sensitive = case_sensitive
-        self.attempts_per_sec = []
+        # Sharded mode: keys come from per-(node, worker) keystreams of a job seed instead of
+        # the OS RNG, so every key is reproducible from (shard, counter)
+        if master_seed is not None and len(master_seed) < 16:
+            raise ValueError("master seed must be at least 16 bytes")
+        if not 0 <= node_id < 2 ** (64 - SHARD_WORKER_BITS):
+            raise ValueError(f"node id must be between 0 and 2**{64 - SHARD_WORKER_BITS} - 1")
+        if not 0 <= counter_start < 2 ** 64:
+            raise ValueError("counter start must be between 0 and 2**64 - 1")
+        self.master_seed = master_seed
+        self.node_id = node_id
+        self.counter_start = counter_start
+        self.found_at = None  # (shard, counter) of the match in sharded mode
+        self.max_seconds = None
+        self.max_attempts = None
+        self.stop_reason = None
+        self.stop_event = mp.Event()
+        # Opt-in stage profiling: fraction of attempts timed, and where to write reports
+        if profile_path and not 0 < profile_rate <= 1:
+            raise ValueError("profile rate must be in (0, 1]")
+        self.profile_rate = profile_rate if profile_path else 0.0
+        self.profile_path = profile_path
+        self.profile_interval = profile_interval
+        self.speed_stats = RollingStats()
         self.pause_event = mp.Event()  # New pause event
+        self.probability = self.pattern_probability(prefix, suffix, case_sensitive)
+        self.supervisor = None
+        self._shard_counters = None  # Next untried counter per worker, shared with the workers
+        self._progress_lock = threading.Lock()
+        self._reset_progress()
+
+    def __getstate__(self):
+        # Workers only need the pattern and events; the lock and process handles can't be pickled
+        state = self.__dict__.copy()
+        del state['_progress_lock']
+        state['supervisor'] = None
+        state['_shard_counters'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._progress_lock = threading.Lock()
+
+    def _reset_progress(self) -> None:
+        with self._progress_lock:
+            self.total_attempts = 0
+            self.worker_rates = {}
+            self.worker_attempts = {}
+            self.start_time = time.time()
+            self.paused_time = 0.0
+            self.last_pause = 0.0
+
+    def _record_attempts(self, worker_id: int, attempts: int, speed: float = None) -> None:
+        with self._progress_lock:
+            self.total_attempts += attempts
+            self.worker_attempts[worker_id] = self.worker_attempts.get(worker_id, 0) + attempts
+            if speed is not None:
+                self.worker_rates[worker_id] = speed
+        if speed is not None:
+            self.speed_stats.add(speed)
+
+    def shard_counters(self) -> Dict[int, Tuple[int, int]]:
+        """Counter range [start, end) each shard has covered, in sharded mode"""
+        counters = self._shard_counters
+        if counters is None:
+            return {}
+        return {shard_id(self.node_id, worker_id): (self.counter_start, end)
+                for worker_id, end in enumerate(counters[:])}
+
+    def _forget_worker(self, worker_id: int) -> None:
+        # A dead worker's last rate no longer contributes to throughput
+        with self._progress_lock:
+            self.worker_rates.pop(worker_id, None)
+
+    def _elapsed(self, now: float) -> float:
+        paused = self.paused_time + (now - self.last_pause if self.last_pause else 0.0)
+        return max(0.0, now - self.start_time - paused)
+
+    def progress(self) -> GenerationProgress:
+        """Cheap snapshot of the running search, safe to call from any thread"""
+        now = time.time()
+        with self._progress_lock:
+            total_attempts = self.total_attempts
+            worker_rates = dict(self.worker_rates)
+            elapsed = self._elapsed(now)
+        # Smoothed over the stats window instead of each worker's last one-second sample
+        workers = len(worker_rates)
+        total_rate = self.speed_stats.recent_rate * workers
+        probability = self.probability
+        # Chance that at least one of the attempts so far was a match
+        match_probability = success_probability(probability, total_attempts)
+        expected_attempts = 1.0 / probability if probability > 0 else float('inf')
+        # The search is memoryless, so the expected remaining work never shrinks
+        eta_seconds = expected_attempts / total_rate if total_rate > 0 else float('inf')
+        budget_attempts_left = float('inf')
+        success_within_budget = None
+        if self.max_attempts is not None:
+            budget_attempts_left = max(0, self.max_attempts - total_attempts)
+        if self.max_seconds is not None:
+            budget_attempts_left = min(budget_attempts_left, max(0.0, self.max_seconds - elapsed) * total_rate)
+        if budget_attempts_left != float('inf'):
+            success_within_budget = success_probability(probability, budget_attempts_left)
+        supervisor = self.supervisor
+        if supervisor:
+            live_workers = supervisor.live_workers
+            expected_workers = supervisor.num_workers
+            restarts = len(supervisor.restarts)
+        else:
+            live_workers = expected_workers = restarts = 0
+        return GenerationProgress(total_attempts, worker_rates, total_rate, elapsed,
+                                  self.pause_event.is_set(), match_probability,
+                                  expected_attempts, eta_seconds,
+                                  live_workers, expected_workers, restarts,
+                                  budget_attempts_left, success_within_budget,
+                                  self.speed_stats.eta(probability, 0.5, workers),
+                                  self.speed_stats.eta(probability, 0.9, workers))
+
+    def stop(self) -> None:
+        """Ask a running generate() to wind down; it returns without a match"""
+        self.stop_reason = self.stop_reason or "stopped"
+        self.stop_event.set()
+
+    def _budget_exhausted(self) -> str:
+        """Reason the run's budget is used up, or an empty string"""
+        if self.max_attempts is not None and self.total_attempts >= self.max_attempts:
+            return "attempt budget reached"
+        if self.max_seconds is not None and self._elapsed(time.time()) >= self.max_seconds:
+            return "time budget reached"
+        return ""
 
     def check_match(self, public_key: str) -> bool:
         if not self.case_sensitive:
@@ -35,69 +519,266 @@ class VanityAddressGenerator:
         
         return matches_prefix and matches_suffix
 
-    def worker_process(self, result_queue: Queue, stop_event: Event) -> None:
+    def _profiled_attempt(self, profile_data, base: int, shard_key: bytes = None,
+                          counter: int = 0) -> Tuple[Keypair, bool]:
+        """One attempt split into timed stages, making the same calls as the unprofiled path"""
+        t0 = time.perf_counter_ns()
+        if shard_key is None:
+            # Keypair() draws its own entropy, so that time lands in derivation
+            t1 = t0
+            keypair = Keypair()
+        else:
+            seed = shard_seed(shard_key, counter)
+            t1 = time.perf_counter_ns()
+            keypair = Keypair.from_seed(seed)
+            _profile_add(profile_data, base, STAGE_ENTROPY, t1 - t0)
+        t2 = time.perf_counter_ns()
+        public_key = str(keypair.pubkey())
+        t3 = time.perf_counter_ns()
+        matched = self.check_match(public_key)
+        t4 = time.perf_counter_ns()
+        _profile_add(profile_data, base, STAGE_DERIVATION, t2 - t1)
+        _profile_add(profile_data, base, STAGE_ENCODING, t3 - t2)
+        _profile_add(profile_data, base, STAGE_MATCHING, t4 - t3)
+        return keypair, matched
+
+    @staticmethod
+    def _claim_attempts(attempt_pool, allowances, worker_id: int, count: int) -> int:
+        """Take up to `count` attempts from a shared attempt budget
+
+        allowances[worker_id] tracks attempts claimed but not yet reported, so
+        the parent can hand a dead worker's unused share back to the pool.
+        """
+        with attempt_pool.get_lock():
+            claimed = min(count, attempt_pool.value)
+            attempt_pool.value -= claimed
+            allowances[worker_id] += claimed
+        return claimed
+
+    @staticmethod
+    def _return_allowance(attempt_pool, allowances, worker_id: int) -> None:
+        """Put a reaped worker's claimed but unreported attempts back in the pool"""
+        with attempt_pool.get_lock():
+            attempt_pool.value += allowances[worker_id]
+            allowances[worker_id] = 0
+
+    @staticmethod
+    def _budget_drained(attempt_pool, allowances) -> bool:
+        """Every attempt in the budget has been claimed and reported"""
+        with attempt_pool.get_lock():
+            return attempt_pool.value == 0 and not any(allowances[:])
+
+    def worker_process(self, worker_id: int, result_queue: Queue, stop_event: Event,
+                       profile_data=None, counters=None, attempt_pool=None, allowances=None) -> None:
         attempts = 0
+        # In sharded mode counters[worker_id] is the next untried keystream counter, kept current
+        # after every attempt so a replacement worker resumes exactly where this one stopped
+        counter = counters[worker_id] if counters is not None else 0
         start_time = time.time()
+        # With an attempt budget, workers draw allowance from a shared pool in chunks
+        allowance = None if attempt_pool is None else 0
+        claim_size = 1024
+        shard = shard_id(self.node_id, worker_id)
+        # With profiling off this stays 0 and the hot loop only pays one falsy check
+        sample_every = max(1, round(1 / self.profile_rate)) if profile_data is not None and self.profile_rate > 0 else 0
+        profile_base = StageProfiler.worker_base(worker_id)
+
+        def put(message):
+            if sample_every:
+                t0 = time.perf_counter_ns()
+                result_queue.put(message)
+                _profile_add(profile_data, profile_base, STAGE_QUEUE, time.perf_counter_ns() - t0)
+            else:
+                result_queue.put(message)
         
-        while not stop_event.is_set():
-            if self.pause_event.is_set():
-                time.sleep(0.1)
-                continue
+        def settle(count):
+            # Attempts about to be reported stop counting as outstanding allowance
+            if allowances is not None:
+                allowances[worker_id] -= count
+        
+        try:
+            # Set up inside the try so a failure here reaches the supervisor with its real cause
+            shard_key = derive_shard_key(self.master_seed, shard) if self.master_seed is not None else None
+            
+            while True:
+                # Decided up front so a timed attempt includes the loop's own control checks
+                sampled = sample_every and (attempts + 1) % sample_every == 0
+                if sampled:
+                    t0 = time.perf_counter_ns()
+                if stop_event.is_set():
+                    break
+                if self.pause_event.is_set():
+                    t_pause = time.perf_counter_ns()
+                    time.sleep(0.1)
+                    if sample_every:
+                        _profile_add(profile_data, profile_base, STAGE_PAUSE, time.perf_counter_ns() - t_pause)
+                    continue
+                if sampled:
+                    _profile_add(profile_data, profile_base, STAGE_CONTROL, time.perf_counter_ns() - t0)
 
-            attempts += 1
-            keypair = Keypair()
-            public_key = str(keypair.pubkey())
+                if allowance is not None and allowance <= 0:
+                    allowance = self._claim_attempts(attempt_pool, allowances, worker_id, claim_size)
+                    if not allowance:
+                        # Budget spent: report what's left, then keep heartbeating until the
+                        # parent stops us or hands back attempts a dead worker didn't use
+                        if attempts or time.time() - start_time >= 1:
+                            settle(attempts)
+                            put(('DRAINED', 0.0, attempts, worker_id))
+                            attempts = 0
+                            start_time = time.time()
+                        time.sleep(0.1)
+                        continue
+
+                attempts += 1
+                if allowance is not None:
+                    allowance -= 1
+                key_counter = counter
+                counter += 1
+                if sampled:
+                    keypair, matched = self._profiled_attempt(profile_data, profile_base, shard_key, key_counter)
+                    if shard_key is not None:
+                        counters[worker_id] = counter
+                elif shard_key is None:
+                    keypair = Keypair()
+                    matched = self.check_match(str(keypair.pubkey()))
+                else:
+                    keypair = Keypair.from_seed(shard_seed(shard_key, key_counter))
+                    matched = self.check_match(str(keypair.pubkey()))
+                    counters[worker_id] = counter
             
-            if self.check_match(public_key):
-                result_queue.put(('SUCCESS', keypair, attempts))
-                return
+                if matched:
+                    found_at = (shard, int(key_counter)) if shard_key is not None else None
+                    settle(attempts)
+                    put(('SUCCESS', keypair, attempts, worker_id, found_at))
+                    return
+                
+                # Calculate speed every second; this doubles as the heartbeat
+                if time.time() - start_time >= 1:
+                    speed = attempts / (time.time() - start_time)
+                    settle(attempts)
+                    put(('SPEED', speed, attempts, worker_id))
+                    attempts = 0
+                    start_time = time.time()
             
-            # Calculate speed every second
-            if time.time() - start_time >= 1:
-                speed = attempts / (time.time() - start_time)
-                result_queue.put(('SPEED', speed, attempts))
-                attempts = 0
-                start_time = time.time()
-
-    def generate(self, num_cores: int) -> Tuple[Keypair, int, float]:
+            # Stopped: report the attempts since the last update so shard coverage is exact
+            if attempts:
+                settle(attempts)
+                put(('SPEED', attempts / max(time.time() - start_time, 1e-9), attempts, worker_id))
+        except Exception as e:
+            # Let the supervisor know why, and count the attempts that were made
+            settle(attempts)
+            result_queue.put(('ERROR', repr(e), attempts, worker_id, os.getpid()))
+            raise
+
+    def generate(self, num_cores: int, max_seconds: float = None,
+                 max_attempts: int = None) -> Tuple[Keypair, int, float]:
+        """Search until a match, a budget limit (seconds excluding pauses, or attempts) or stop()"""
+        check_budget(max_seconds, max_attempts)
         mp.freeze_support()  # For Windows support
         result_queue = mp.Queue()
-        stop_event = mp.Event()
+        self.stop_event = stop_event = mp.Event()
         self.pause_event.clear()  # Initialize as unpaused
+        self.speed_stats = RollingStats(window=10 * num_cores)
+        self.max_seconds = max_seconds
+        self.max_attempts = max_attempts
+        self.stop_reason = None
+        self.found_at = None
         
         # Calculate and show initial estimate
-        est_seconds, combinations = self.estimate_time(self.prefix, self.suffix, num_cores)
+        est_seconds, combinations = self.estimate_time(self.prefix, self.suffix, num_cores, self.case_sensitive)
         if est_seconds == float('inf'):
             print("\nError: Invalid pattern! Only Base58 characters are allowed.")
             print("Valid characters: 123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+            self.stop_reason = "invalid pattern"
             return None, 0, 0
             
         print(f"\nPattern Analysis:")
         print(f"Total possible combinations: {combinations:,}")
-        print(f"Estimated time (average case): {timedelta(seconds=int(est_seconds))}")
+        print(f"Estimated time (average case): {format_duration(est_seconds)}")
         if est_seconds > 3600 * 24:  # More than a day
             print("\nWarning: This pattern might take a very long time!")
             print("Consider using a shorter pattern or more CPU cores.")
+        if max_seconds is not None or max_attempts is not None:
+            budget = self.budget_attempts(num_cores, max_seconds, max_attempts)
+            limits = []
+            if max_seconds is not None:
+                limits.append(format_duration(max_seconds))
+            if max_attempts is not None:
+                limits.append(f"{max_attempts:,} attempts")
+            print(f"\nBudget: {' or '.join(limits)} (~{budget:,.0f} attempts)")
+            print(f"Chance of success within budget: {success_probability(self.probability, budget):.1%}")
         
         print("\nPress 'p' to pause/resume")
         print("Press 'q' to quit to main menu")
         print("Generation starting...\n")
         
+        profiler = None
+        if self.profile_rate > 0:
+            profiler = StageProfiler(num_cores, self.profile_rate, self.profile_path)
+            print(f"Profiling {self.profile_rate:.2%} of attempts to {profiler.path} and {profiler.trace_path}\n")
+        
+        # A hard attempt cap is enforced by the workers themselves, not by polling reports
+        attempt_pool = allowances = None
+        if max_attempts is not None:
+            attempt_pool = mp.Value('q', max_attempts)
+            allowances = mp.Array('q', num_cores, lock=False)
+        counters = None
+        if self.master_seed is not None:
+            counters = mp.Array('Q', [self.counter_start] * num_cores, lock=False)
+        self._shard_counters = counters
+        
         # Start worker processes
-        processes = []
-        for _ in range(num_cores):
-            p = mp.Process(target=self.worker_process, args=(result_queue, stop_event))
+        def spawn(worker_id):
+            # A respawned worker picks its shard up from the counter its predecessor published
+            p = mp.Process(target=self.worker_process,
+                           args=(worker_id, result_queue, stop_event,
+                                 profiler.data if profiler else None, counters, attempt_pool, allowances))
             p.start()
-            processes.append(p)
+            return p
 
-        total_attempts = 0
-        start_time = time.time()
+        def reap(worker_id):
+            # A dead worker's last rate no longer counts, and its unused attempts go back to the pool
+            self._forget_worker(worker_id)
+            if attempt_pool is not None:
+                self._return_allowance(attempt_pool, allowances, worker_id)
+
+        supervisor = WorkerSupervisor(spawn, num_cores, on_exit=reap)
+        supervisor.start()
+        self.supervisor = supervisor
+
+        self._reset_progress()
         found_keypair = None
-        paused_time = 0
-        last_pause = 0
+        last_check = time.time()
+        last_profile = time.time()
+        last_status = 0.0
         
         try:
             while True:
+                if profiler and time.time() - last_profile >= self.profile_interval:
+                    last_profile = time.time()
+                    profiler.export()
+
+                if stop_event.is_set():
+                    break  # stop() from another thread
+                exhausted = self._budget_exhausted()
+                if not exhausted and attempt_pool is not None and self._budget_drained(attempt_pool, allowances):
+                    exhausted = "attempt budget reached"
+                if exhausted:
+                    self.stop_reason = exhausted
+                    break
+
+                # Check worker health about once a second
+                if time.time() - last_check >= 1:
+                    last_check = time.time()
+                    for restart in supervisor.check(self.pause_event.is_set()):
+                        print(f"\r\033[33m[WORKER {restart.worker_id}]\033[0m {restart.reason}"
+                              f"{'' if restart.worker_id in supervisor.abandoned else ', restarted'}",
+                              end=" "*50 + "\n")
+                    if supervisor.all_failed:
+                        self.stop_reason = "all workers failed"
+                        print("\r\033[31m[FAILED]\033[0m Every worker was given up on; stopping", end=" "*50 + "\n")
+                        break
+
                 # Check for keyboard input
                 if os.name == 'nt':  # Windows
                     if msvcrt.kbhit():
@@ -116,10 +797,9 @@ class VanityAddressGenerator:
                                     confirm = msvcrt.getch().decode().lower()
                                     if confirm == 'y':
                                         print("\nReturning to main menu...")
+                                        self.stop_reason = "cancelled"
                                         stop_event.set()
-                                        for p in processes:
-                                            p.terminate()
-                                        return None, total_attempts, time.time() - start_time - paused_time
+                                        break
                                     elif confirm == 'n':
                                         if not self.pause_event.is_set():
                                             self.pause_event.clear()  # Resume if we were not paused before
@@ -142,72 +822,110 @@ class VanityAddressGenerator:
                                     confirm = sys.stdin.read(1).lower()
                                     if confirm == 'y':
                                         print("\nReturning to main menu...")
+                                        self.stop_reason = "cancelled"
                                         stop_event.set()
-                                        for p in processes:
-                                            p.terminate()
-                                        return None, total_attempts, time.time() - start_time - paused_time
+                                        break
                                     elif confirm == 'n':
                                         if not self.pause_event.is_set():
                                             self.pause_event.clear()  # Resume if we were not paused before
                                         break
 
                 if self.pause_event.is_set():
-                    if last_pause == 0:
-                        last_pause = time.time()
+                    if self.last_pause == 0:
+                        self.last_pause = time.time()
                         print("\r\033[33m[PAUSED]\033[0m Press 'p' to resume or 'q' to quit", end=" "*50)
                     time.sleep(0.1)
                     continue
-                elif last_pause > 0:
-                    paused_time += time.time() - last_pause
-                    last_pause = 0
+                elif self.last_pause > 0:
+                    with self._progress_lock:
+                        self.paused_time += time.time() - self.last_pause
+                        self.last_pause = 0
                     print("\r\033[32m[RESUMED]\033[0m", end=" "*50)
 
                 try:
-                    result = result_queue.get_nowait()
+                    result = result_queue.get(timeout=0.05)
                     if result[0] == 'SUCCESS':
                         stop_event.set()
+                        self.stop_reason = "found"
                         found_keypair = result[1]
-                        total_attempts += result[2]
+                        self.found_at = result[4]
+                        self._record_attempts(result[3], result[2])
                         break
+                    elif result[0] == 'ERROR':
+                        supervisor.report_error(result[3], result[1], result[4])
+                        self._record_attempts(result[3], result[2])
+                        continue
+                    elif result[0] == 'DRAINED':
+                        # Out of budget but alive; it no longer adds to throughput
+                        supervisor.heartbeat(result[3])
+                        self._record_attempts(result[3], result[2])
+                        self._forget_worker(result[3])
                     else:  # SPEED update
-                        self.attempts_per_sec.append(result[1])
-                        total_attempts += result[2]
+                        supervisor.heartbeat(result[3])
+                        self._record_attempts(result[3], result[2], result[1])
                 except queue.Empty:
-                    continue
+                    # Keep the status line fresh even when no worker is reporting
+                    if time.time() - last_status < 1:
+                        continue
                 
-                # Calculate and display statistics
-                elapsed = time.time() - start_time - paused_time
-                avg_speed = sum(self.attempts_per_sec) / len(self.attempts_per_sec)
-                if len(self.attempts_per_sec) > 1:
-                    recent_speed = statistics.mean(self.attempts_per_sec[-10:])
-                else:
-                    recent_speed = avg_speed
+                if stop_event.is_set():
+                    continue  # Winding down; workers leaving now isn't degraded throughput
                 
-                # Estimate time remaining based on probability
-                possible_combinations = 58 ** len(self.prefix + self.suffix)  # Base58 encoding
-                estimated_total_attempts = possible_combinations / 2  # Average case
-                remaining_attempts = max(0, estimated_total_attempts - total_attempts)
-                time_remaining = remaining_attempts / (recent_speed * num_cores)
+                # Calculate and display statistics
+                last_status = time.time()
+                progress = self.progress()
                 
                 # Clear line and update progress
                 status = "\033[32m[RUNNING]\033[0m"  # Green color for running
-                print(f"\r{status} Speed: {recent_speed * num_cores:,.0f} addr/s | "
-                      f"Total: {total_attempts:,} | "
-                      f"Elapsed: {timedelta(seconds=int(elapsed))} | "
-                      f"Est. Remaining: {timedelta(seconds=int(time_remaining))} | "
+                if progress.degraded:
+                    status = f"\033[33m[DEGRADED {progress.live_workers}/{progress.expected_workers}]\033[0m"
+                odds = f"Odds so far: {progress.match_probability:.1%}"
+                if progress.success_within_budget is not None:
+                    odds += f" | Within budget: {progress.success_within_budget:.1%}"
+                print(f"\r{status} Speed: {progress.total_rate:,.0f} addr/s | "
+                      f"Total: {progress.total_attempts:,} | "
+                      f"Elapsed: {timedelta(seconds=int(progress.elapsed))} | "
+                      f"Expected Remaining: {format_duration(progress.eta_seconds)} "
+                      f"(~{progress.expected_attempts:,.0f} attempts) | "
+                      f"50%/90% Within: {format_duration(progress.eta_p50)}/{format_duration(progress.eta_p90)} | "
+                      f"{odds} | "
                       f"Press 'p' to pause/resume or 'q' to quit", 
                       end="")
 
         finally:
             stop_event.set()
-            for p in processes:
-                p.terminate()
-                p.join()
+            self._wind_down(result_queue, supervisor)
+            if profiler:
+                profiler.export()
 
-        return found_keypair, total_attempts, time.time() - start_time - paused_time
+        return found_keypair, self.total_attempts, self._elapsed(time.time())
+
+    def _wind_down(self, result_queue: Queue, supervisor: WorkerSupervisor, timeout: float = 2.0) -> None:
+        """Collect the workers' final counts after stop_event is set, then stop any stragglers"""
+        deadline = time.time() + timeout
+        while True:
+            try:
+                result = result_queue.get(timeout=0.05)
+            except queue.Empty:
+                if not supervisor.live_workers or time.time() >= deadline:
+                    break
+                continue
+            # Every message carries (kind, ..., attempts, worker_id); a second match is dropped
+            self._record_attempts(result[3], result[2])
+        supervisor.stop()
+
+    @staticmethod
+    def budget_attempts(num_cores: int, max_seconds: float = None, max_attempts: int = None) -> float:
+        """Attempts a budget buys, using this machine's measured single-core speed"""
+        budget = float('inf')
+        if max_attempts is not None:
+            budget = max_attempts
+        if max_seconds is not None:
+            budget = min(budget, max_seconds * calibrate_throughput() * num_cores)
+        return budget
 
     @staticmethod
-    def save_to_file(keypair: Keypair, filename: str, prefix: str = "", suffix: str = ""):
+    def wallet_record(keypair: Keypair, prefix: str = "", suffix: str = "", **extra) -> dict:
         secret_key = base58.b58encode(bytes(keypair.secret())).decode('ascii')
         wallet_data = {
             "public_key": str(keypair.pubkey()),
@@ -217,35 +935,30 @@ class VanityAddressGenerator:
                 "suffix": suffix
             }
         }
+        wallet_data.update(extra)
+        return wallet_data
+
+    @staticmethod
+    def save_to_file(keypair: Keypair, filename: str, prefix: str = "", suffix: str = "", **extra):
+        wallet_data = VanityAddressGenerator.wallet_record(keypair, prefix, suffix, **extra)
         with open(filename, 'w') as f:
             json.dump(wallet_data, f, indent=2)
 
     @staticmethod
-    def estimate_time(prefix: str, suffix: str, num_cores: int) -> Tuple[float, int]:
+    def pattern_probability(prefix: str, suffix: str, case_sensitive: bool = True) -> float:
+        """Chance that a single random address matches the pattern"""
+        probability = 1.0
+        for char in prefix + suffix:
+            probability *= base58_matches(char, case_sensitive) / 58
+        return probability
+
+    @staticmethod
+    def estimate_time(prefix: str, suffix: str, num_cores: int, case_sensitive: bool = True) -> Tuple[float, int]:
         """Calculate a more accurate time estimate based on pattern complexity"""
-        # Base58 character set (numbers + lowercase + uppercase, excluding 0OIl)
-        BASE58_CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-        
-        # Calculate prefix probability
-        prefix_prob = 1.0
-        if prefix:
-            for char in prefix:
-                if char in BASE58_CHARS:
-                    prefix_prob *= (1.0 / 58)  # Exact match needed
-                else:
-                    return float('inf'), 0  # Invalid character
-        
-        # Calculate suffix probability
-        suffix_prob = 1.0
-        if suffix:
-            for char in suffix:
-                if char in BASE58_CHARS:
-                    suffix_prob *= (1.0 / 58)  # Exact match needed
-                else:
-                    return float('inf'), 0  # Invalid character
-        
-        # Total probability is the product of both probabilities
-        total_prob = prefix_prob * suffix_prob
+        # Same rule as the GUI's pattern analysis: every character must match some Base58 digit
+        total_prob = VanityAddressGenerator.pattern_probability(prefix, suffix, case_sensitive)
+        if total_prob == 0:
+            return float('inf'), 0  # Invalid character
         
         # Calculate total possible combinations
         pattern_length = len(prefix + suffix)
@@ -266,6 +979,433 @@ class VanityAddressGenerator:
         
         return estimated_seconds, possible_combinations
 
+class ResultSink:
+    """Appends found wallets to rotating JSONL logs from a dedicated writer thread
+
+    Records are group-committed: written and flushed once batch_size records
+    are waiting or flush_interval seconds have passed. fsync is 'commit'
+    (after every group commit), 'close' (only on rotation and close) or 'never'.
+    With resume, the first commit appends to the newest log that still has room.
+    """
+    FSYNC_MODES = ('commit', 'close', 'never')
+
+    def __init__(self, directory: str = '.', basename: str = 'vanity-wallets', batch_size: int = 64,
+                 flush_interval: float = 0.05, fsync: str = 'commit', max_bytes: int = 64 * 1024 * 1024,
+                 resume: bool = True):
+        if fsync not in self.FSYNC_MODES:
+            raise ValueError(f"fsync must be one of {', '.join(self.FSYNC_MODES)}")
+        self.directory = directory
+        self.basename = basename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.resume = resume
+        self.current_path = None
+        self.written = 0
+        self.error = None
+        self.pending = []
+        self._file = None
+        self._sequence = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="result-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: dict) -> None:
+        """Queue a record for writing; never blocks on disk I/O"""
+        if self.error:
+            raise RuntimeError(f"result sink failed: {self.error}")
+        self._queue.put(record)
+
+    def flush(self, timeout: float = None) -> None:
+        """Block until everything submitted so far has been committed"""
+        if self.error:
+            raise RuntimeError(f"result sink failed: {self.error}")
+        if not self._thread.is_alive():
+            raise RuntimeError("result sink is closed")
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Wait in slices so a writer that exits without reaching the barrier can't strand us
+        while not barrier.wait(0.1 if deadline is None else min(0.1, max(0.0, deadline - time.monotonic()))):
+            if self.error or not self._thread.is_alive():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError("result sink did not commit in time")
+        if self.error:
+            raise RuntimeError(f"result sink failed: {self.error}")
+        if not barrier.is_set():
+            raise RuntimeError("result sink stopped before committing")
+
+    def close(self, timeout: float = None) -> None:
+        """Write everything still queued, sync it and stop the writer"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self.error:
+            raise RuntimeError(f"result sink failed: {self.error}")
+
+    def _latest_log(self) -> str:
+        """Newest existing log below max_bytes, or None"""
+        latest = None
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(self.basename + '-') and entry.name.endswith('.jsonl')):
+                    continue
+                stat = entry.stat()
+                if entry.is_file() and stat.st_size < self.max_bytes and (
+                        latest is None or stat.st_mtime > latest[0]):
+                    latest = (stat.st_mtime, entry.path if self.directory != '.' else entry.name)
+        return latest[1] if latest else None
+
+    def _open(self) -> None:
+        self._sequence += 1
+        path = self._latest_log() if self.resume and self._sequence == 1 else None
+        if path is None:
+            while True:
+                filename = f"{self.basename}-{int(time.time())}-{os.getpid()}-{self._sequence}.jsonl"
+                path = os.path.join(self.directory, filename) if self.directory != '.' else filename
+                if not os.path.exists(path):
+                    break
+                self._sequence += 1  # Another sink in this process got the name first
+        self.current_path = path
+        self._file = open(self.current_path, 'a', encoding='utf-8')
+        if self.fsync != 'never':
+            self._sync_directory()
+
+    def _sync_directory(self) -> None:
+        # Make the new file's directory entry durable too (not possible on Windows)
+        if os.name == 'nt':
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _close_file(self) -> None:
+        if self._file:
+            self._file.flush()
+            if self.fsync != 'never':
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def _commit(self, batch: List[dict]) -> None:
+        if self._file is None:
+            self._open()
+        self._file.write("".join(json.dumps(record, separators=(',', ':')) + "\n" for record in batch))
+        self._file.flush()
+        if self.fsync == 'commit':
+            os.fsync(self._file.fileno())
+        self.written += len(batch)
+        if self._file.tell() >= self.max_bytes:
+            self._close_file()  # The next commit opens a fresh file
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch = []
+            barriers = []
+            record = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while record is not None:
+                if isinstance(record, threading.Event):
+                    barriers.append(record)
+                    break  # Someone is waiting, commit now
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            closing = record is None
+            try:
+                if batch:
+                    self._commit(batch)
+                if closing:
+                    self._close_file()
+            except Exception as e:
+                # Keep the unwritten records around rather than dropping found keys
+                self.error = e
+                self.pending = batch
+                while True:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(record, threading.Event):
+                        barriers.append(record)
+                    elif record is not None:
+                        self.pending.append(record)
+                closing = True
+            finally:
+                for barrier in barriers:
+                    barrier.set()
+
+DEFAULT_CORE_SPEED = 150000  # Attempts per core per second on average hardware
+
+class PatternAnalysis(NamedTuple):
+    valid: bool
+    invalid_chars: Tuple[Tuple[str, int, str], ...]  # (field, index, char)
+    probability: float
+    expected_attempts: float
+    speed: float
+    expected_seconds: float
+    eta_p50: float
+    eta_p90: float
+    eta_p99: float
+
+@functools.lru_cache(maxsize=None)
+def calibrate_throughput(duration: float = 0.5) -> float:
+    """Measure single-core attempts per second on this machine"""
+    generator = VanityAddressGenerator("zzzzzzzz")
+    attempts = 0
+    start_time = time.perf_counter()
+    deadline = start_time + duration
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            generator.check_match(str(Keypair().pubkey()))
+        attempts += 100
+    return attempts / (time.perf_counter() - start_time)
+
+@functools.lru_cache(maxsize=1024)
+def analyze_pattern(prefix: str, suffix: str, case_sensitive: bool, num_cores: int,
+                    core_speed: float = DEFAULT_CORE_SPEED) -> PatternAnalysis:
+    """Validity, odds and ETAs for a pattern; memoized per pattern and config"""
+    invalid_chars = tuple((field, i, char)
+                          for field, pattern in (("prefix", prefix), ("suffix", suffix))
+                          for i, char in enumerate(pattern)
+                          if not base58_matches(char, case_sensitive))
+    probability = VanityAddressGenerator.pattern_probability(prefix, suffix, case_sensitive)
+    expected_attempts = 1.0 / probability if probability > 0 else float('inf')
+    speed = core_speed * max(1, num_cores)
+    return PatternAnalysis(
+        valid=not invalid_chars and bool(prefix or suffix),
+        invalid_chars=invalid_chars,
+        probability=probability,
+        expected_attempts=expected_attempts,
+        speed=speed,
+        expected_seconds=expected_attempts / speed,
+        eta_p50=geometric_quantile(probability, 0.5) / speed,
+        eta_p90=geometric_quantile(probability, 0.9) / speed,
+        eta_p99=geometric_quantile(probability, 0.99) / speed,
+    )
+
+def list_wallet_files(directory: str = '.') -> Iterator[str]:
+    """Yield saved wallet paths without reading them"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            is_wallet = entry.name.startswith('vanity-wallet-') and entry.name.endswith('.json')
+            is_log = entry.name.startswith('vanity-wallets-') and entry.name.endswith('.jsonl')
+            if (is_wallet or is_log) and entry.is_file():
+                yield entry.path if directory != '.' else entry.name
+
+def iter_saved_wallets(directory: str = '.') -> Iterator[Tuple[str, dict]]:
+    """Stream (filename, wallet data) pairs, skipping unreadable files and non-object records"""
+    for path in list_wallet_files(directory):
+        try:
+            with open(path, 'r') as f:
+                if not path.endswith('.jsonl'):
+                    data = json.load(f)
+                    if isinstance(data, dict):
+                        yield path, data
+                    continue
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue  # A torn final line from a crash
+                    if isinstance(data, dict):
+                        yield f"{path}:{line_number}", data
+        except (OSError, ValueError):
+            continue
+
+def format_search_patterns(data: dict) -> str:
+    patterns = []
+    search_patterns = data.get("search_patterns")
+    if not isinstance(search_patterns, dict):
+        return ""
+    if search_patterns.get("prefix"):
+        patterns.append(f"prefix='{search_patterns['prefix']}'")
+    if search_patterns.get("suffix"):
+        patterns.append(f"suffix='{search_patterns['suffix']}'")
+    return ', '.join(patterns)
+
+EXPORT_FORMATS = ('solana', 'base58', 'csv')
+
+class VerifyResult(NamedTuple):
+    source: str
+    public_key: str
+    ok: bool
+    reason: str
+    keypair_bytes: bytes  # 64-byte keypair when it was re-derived, else b""
+
+class VerifyReport(NamedTuple):
+    checked: int
+    verified: int
+    failures: List[VerifyResult]
+    exported: Dict[str, str]
+
+def _verify_record(source: str, data: dict, matchers: dict) -> VerifyResult:
+    public_key = str(data.get('public_key', ''))
+    try:
+        secret = base58.b58decode(data['secret_key'])
+        keypair = Keypair.from_seed(secret) if len(secret) == 32 else Keypair.from_bytes(secret)
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        return VerifyResult(source, public_key, False, f"bad secret key: {e!r}", b"")
+    derived = str(keypair.pubkey())
+    if derived != public_key:
+        return VerifyResult(source, public_key, False, f"secret key derives {derived}", b"")
+    patterns = data.get('search_patterns') or {}
+    # Older files don't record case sensitivity; the case-insensitive check accepts both
+    key = (str(patterns.get('prefix') or ''), str(patterns.get('suffix') or ''),
+           bool(data.get('case_sensitive', False)))
+    if key not in matchers:
+        matchers[key] = VanityAddressGenerator(*key)
+    if not matchers[key].check_match(derived):
+        return VerifyResult(source, public_key, False,
+                            f"does not match {format_search_patterns(data)}", bytes(keypair))
+    return VerifyResult(source, public_key, True, "", bytes(keypair))
+
+def _verify_chunk(chunk: List[Tuple[str, dict]]) -> List[VerifyResult]:
+    """Re-derive and check one chunk of wallets; runs in a pool worker"""
+    results = []
+    matchers = {}
+    for source, data in chunk:
+        try:
+            results.append(_verify_record(source, data, matchers))
+        except Exception as e:
+            # One malformed record is a failure to report, not a reason to abort the audit
+            public_key = data.get('public_key', '') if isinstance(data, dict) else ''
+            results.append(VerifyResult(source, str(public_key), False, f"malformed record: {e!r}", b""))
+    return results
+
+def _open_private(path: str, newline: str = None):
+    """Open a file for writing that only the owner can read, like solana-keygen does"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, 'fchmod'):
+        os.fchmod(fd, 0o600)  # The mode above only applies when the file is new
+    return os.fdopen(fd, 'w', newline=newline)
+
+def _chunks(iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def verify_wallets(directory: str = '.', export_dir: str = None, formats: Tuple[str, ...] = (),
+                   processes: int = None, chunk_size: int = 2000,
+                   on_progress: Callable[[int], None] = None) -> VerifyReport:
+    """Re-derive every saved wallet across a process pool, optionally exporting the good ones
+
+    Wallets are streamed from disk and at most a few chunks per process are in
+    flight, so memory stays flat however large the archive is.
+    """
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"unknown export format(s): {', '.join(sorted(unknown))}")
+    processes = processes or mp.cpu_count()
+    exported = {}
+    files = {}
+    if formats:
+        os.makedirs(export_dir, mode=0o700, exist_ok=True)
+        if 'solana' in formats:
+            exported['solana'] = os.path.join(export_dir, 'solana')
+            os.makedirs(exported['solana'], mode=0o700, exist_ok=True)
+        if 'base58' in formats:
+            exported['base58'] = os.path.join(export_dir, 'keypairs-base58.txt')
+            files['base58'] = _open_private(exported['base58'])
+        if 'csv' in formats:
+            exported['csv'] = os.path.join(export_dir, 'pubkeys.csv')
+            files['csv'] = open(exported['csv'], 'w', newline='')
+            files['csv_writer'] = csv.writer(files['csv'])
+            files['csv_writer'].writerow(["public_key", "source"])
+
+    def export(result: VerifyResult) -> None:
+        if 'solana' in formats:
+            # Same layout as `solana-keygen`: a JSON array of the 64 keypair bytes
+            with _open_private(os.path.join(exported['solana'], f"{result.public_key}.json")) as f:
+                json.dump(list(result.keypair_bytes), f)
+        if 'base58' in formats:
+            files['base58'].write(f"{result.public_key} {base58.b58encode(result.keypair_bytes).decode('ascii')}\n")
+        if 'csv' in formats:
+            files['csv_writer'].writerow([result.public_key, result.source])
+
+    checked = verified = 0
+    failures = []
+    try:
+        with mp.Pool(processes) as pool:
+            pending = deque()
+            chunks = _chunks(iter_saved_wallets(directory), chunk_size)
+            while True:
+                # Keep the pool busy without reading the whole archive ahead of it
+                while len(pending) < processes * 2:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append(pool.apply_async(_verify_chunk, (chunk,)))
+                if not pending:
+                    break
+                for result in pending.popleft().get():
+                    checked += 1
+                    if result.ok:
+                        verified += 1
+                        if formats:
+                            export(result)
+                    else:
+                        failures.append(result)
+                if on_progress:
+                    on_progress(checked)
+    finally:
+        for name in ('base58', 'csv'):
+            if name in files:
+                files[name].close()
+    return VerifyReport(checked, verified, failures, exported)
+
+def verify_saved_addresses():
+    clear_screen()
+    print_banner()
+    print("\nVerify / Export Saved Addresses")
+    print("-------------------------------")
+    
+    if next(list_wallet_files('.'), None) is None:
+        print("\nNo saved addresses found!")
+        input("\nPress Enter to continue...")
+        return
+    
+    print(f"\nExport formats: {', '.join(EXPORT_FORMATS)}")
+    formats = tuple(f.strip() for f in input("Formats to export (comma separated, blank to only verify): ")
+                    .lower().split(',') if f.strip())
+    if set(formats) - set(EXPORT_FORMATS):
+        print("Unknown export format!")
+        input("\nPress Enter to continue...")
+        return
+    export_dir = None
+    if formats:
+        export_dir = input("Export directory [wallet-export]: ").strip() or "wallet-export"
+        print("\nWarning: exports contain private keys. Keep them somewhere safe!")
+    
+    start_time = time.time()
+    report = verify_wallets('.', export_dir, formats,
+                            on_progress=lambda n: print(f"\rChecked {n:,} wallets...", end=""))
+    
+    print(f"\n\nChecked {report.checked:,} wallets in {timedelta(seconds=int(time.time() - start_time))}")
+    print(f"Verified: {report.verified:,}")
+    print(f"Problems: {len(report.failures):,}")
+    for failure in report.failures[:20]:
+        print(f"  {failure.source}: {failure.public_key or '?'} - {failure.reason}")
+    if len(report.failures) > 20:
+        print(f"  ... and {len(report.failures) - 20:,} more")
+    for name, path in report.exported.items():
+        print(f"Exported {name} to {path}")
+    
+    input("\nPress Enter to continue...")
+
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -282,13 +1422,14 @@ def get_menu_choice():
     print("\nOptions:")
     print("1. Generate new vanity address")
     print("2. View saved addresses")
-    print("3. Exit")
+    print("3. Verify / export saved addresses")
+    print("4. Exit")
     while True:
         try:
-            choice = int(input("\nEnter your choice (1-3): "))
-            if 1 <= choice <= 3:
+            choice = int(input("\nEnter your choice (1-4): "))
+            if 1 <= choice <= 4:
                 return choice
-            print("Please enter a number between 1 and 3")
+            print("Please enter a number between 1 and 4")
         except ValueError:
             print("Please enter a valid number")
 
@@ -300,7 +1441,30 @@ def reset_terminal():
         # Force terminal to echo input
         os.system('stty echo')
 
-def main():
+MASTER_SEED_ENV = "SOL_VANITY_MASTER_SEED"
+
+def load_master_seed(path: str = None) -> bytes:
+    """Hex job seed from a file ('-' prompts for it) or $SOL_VANITY_MASTER_SEED; None if neither"""
+    if path == '-':
+        text = getpass.getpass("Master seed (hex): ")
+    elif path:
+        with open(path, 'r') as f:
+            text = f.read()
+    else:
+        text = os.environ.get(MASTER_SEED_ENV)
+        if not text:
+            return None
+    try:
+        master_seed = bytes.fromhex(text.strip())
+    except ValueError:
+        raise ValueError("master seed must be hex")
+    if len(master_seed) < 16:
+        raise ValueError("master seed must be at least 16 bytes (32 hex characters)")
+    return master_seed
+
+def main(**generator_options):
+    # One sink for the whole session, so every wallet found goes through the same log
+    sink = ResultSink()
     try:
         while True:
             clear_screen()
@@ -310,17 +1474,23 @@ def main():
             choice = get_menu_choice()
             
             if choice == 1:
-                generate_new_address()
+                generate_new_address(sink, **generator_options)
                 reset_terminal()  # Reset terminal after generation
             elif choice == 2:
                 view_saved_addresses()
+            elif choice == 3:
+                verify_saved_addresses()
             else:
                 print("\nGoodbye!")
                 break
     finally:
+        try:
+            sink.close(timeout=10)
+        except RuntimeError as e:
+            print(f"\nCould not write the wallet log: {e}")
         reset_terminal()  # Ensure terminal is reset even if program crashes
 
-def generate_new_address():
+def generate_new_address(sink: ResultSink, **generator_options):
     clear_screen()
     print_banner()
     print("\nGenerate New Vanity Address")
@@ -366,12 +1536,34 @@ def generate_new_address():
         except ValueError:
             print("Please enter a valid number")
 
+    # Optional hard limits; the run stops cleanly when either is reached
+    max_seconds = max_attempts = None
+    while True:
+        try:
+            limit = input("\nTime limit in minutes (blank for none): ").strip()
+            max_seconds = float(limit) * 60 if limit else None
+            limit = input("Attempt limit (blank for none): ").strip().replace(',', '')
+            max_attempts = int(limit) if limit else None
+            check_budget(max_seconds, max_attempts)
+            break
+        except ValueError:
+            print("Please enter positive numbers, or leave blank for no limit")
+
     # Calculate and show time estimate
-    est_seconds, combinations = VanityAddressGenerator.estimate_time(prefix, suffix, num_cores)
+    est_seconds, combinations = VanityAddressGenerator.estimate_time(prefix, suffix, num_cores, case_sensitive)
+    if est_seconds == float('inf'):
+        print("\nInvalid pattern! Only Base58 characters are allowed.")
+        print(f"Valid characters: {BASE58_CHARS}")
+        input("\nPress Enter to continue...")
+        return
     print("\nPattern Analysis:")
     print("-----------------")
     print(f"Total possible combinations: {combinations:,}")
-    print(f"Estimated time to find (average case): {timedelta(seconds=int(est_seconds))}")
+    print(f"Estimated time to find (average case): {format_duration(est_seconds)}")
+    if max_seconds is not None or max_attempts is not None:
+        budget = VanityAddressGenerator.budget_attempts(num_cores, max_seconds, max_attempts)
+        probability = VanityAddressGenerator.pattern_probability(prefix, suffix, case_sensitive)
+        print(f"Chance of success within budget: {success_probability(probability, budget):.1%}")
     
     if est_seconds > 3600:  # If estimated time is more than an hour
         print("\nWarning: This pattern might take a long time to generate!")
@@ -399,19 +1591,50 @@ def generate_new_address():
         os.system('stty -echo')
     
     try:
-        generator = VanityAddressGenerator(prefix, suffix, case_sensitive)
-        keypair, attempts, elapsed = generator.generate(num_cores)
+        generator = VanityAddressGenerator(prefix, suffix, case_sensitive, **generator_options)
+        keypair, attempts, elapsed = generator.generate(num_cores, max_seconds, max_attempts)
+        
+        if generator.master_seed is not None:
+            # Per-shard coverage, so runs on other nodes can be summed without overlap
+            print("\n\nShard coverage (shard: counters [start, end)):")
+            for shard, (start, end) in generator.shard_counters().items():
+                print(f"  {shard:#x}: [{start:,}, {end:,})")
         
         if keypair:  # Only if generation wasn't cancelled
             print("\n\nFound matching address!")
             print(f"Public Key: {keypair.pubkey()}")
             print(f"Total Attempts: {attempts:,}")
             print(f"Time taken: {timedelta(seconds=int(elapsed))}")
+            extra = {"case_sensitive": case_sensitive}
+            if generator.found_at:
+                shard, counter = generator.found_at
+                extra.update(shard=shard, counter=counter)
+                print(f"Found at shard {shard:#x}, counter {counter:,}")
 
             # Save the keypair with search patterns
-            filename = f"vanity-wallet-{int(time.time())}.json"
-            VanityAddressGenerator.save_to_file(keypair, filename, prefix, suffix)
-            print(f"\nKeypair saved to {filename}")
+            try:
+                sink.submit(VanityAddressGenerator.wallet_record(keypair, prefix, suffix, **extra))
+                try:
+                    sink.flush(timeout=10)
+                except TimeoutError:
+                    # The record is already queued; writing it elsewhere too would store it twice
+                    print("\nWaiting for the disk to confirm the save...")
+                    sink.flush()
+                print(f"\nKeypair saved to {sink.current_path}")
+            except RuntimeError as e:
+                filename = f"vanity-wallet-{int(time.time())}.json"
+                VanityAddressGenerator.save_to_file(keypair, filename, prefix, suffix, **extra)
+                print(f"\nCould not append to the wallet log ({e}); keypair saved to {filename}")
+        elif generator.stop_reason and generator.stop_reason.endswith("budget reached"):
+            print(f"\n\nNo match: {generator.stop_reason}.")
+            print(f"Total Attempts: {attempts:,}")
+            print(f"Time taken: {timedelta(seconds=int(elapsed))}")
+            print(f"Odds of a match with that much work were {success_probability(generator.probability, attempts):.1%}")
+        elif generator.stop_reason == "all workers failed":
+            print(f"\n\nGeneration failed: {generator.stop_reason}.")
+            for restart in generator.supervisor.restarts[-3:]:
+                print(f"  Worker {restart.worker_id}: {restart.reason}")
+            print(f"Total Attempts: {attempts:,}")
     finally:
         # Re-enable terminal echo for Unix-like systems
         if os.name != 'nt':
@@ -425,9 +1648,7 @@ def view_saved_addresses():
     print("\nSaved Addresses")
     print("--------------")
     
-    wallet_files = [f for f in os.listdir('.') if f.startswith('vanity-wallet-') and f.endswith('.json')]
-    
-    if not wallet_files:
+    if next(list_wallet_files('.'), None) is None:
         print("\nNo saved addresses found!")
         input("\nPress Enter to continue...")
         return
@@ -437,23 +1658,16 @@ def view_saved_addresses():
         print("\nWarning: Never share your private keys with anyone!")
         print("They provide full access to your wallet.\n")
         
-    for i, file in enumerate(wallet_files, 1):
-        with open(file, 'r') as f:
-            data = json.load(f)
-            print(f"\n{i}. File: {file}")
-            print(f"   Public Key: {data['public_key']}")
-            if show_private:
-                print(f"   Private Key: {data['secret_key']}")
-            
-            # Display search patterns if they exist in the file
-            if "search_patterns" in data:
-                patterns = []
-                if data["search_patterns"]["prefix"]:
-                    patterns.append(f"prefix='{data['search_patterns']['prefix']}'")
-                if data["search_patterns"]["suffix"]:
-                    patterns.append(f"suffix='{data['search_patterns']['suffix']}'")
-                if patterns:
-                    print(f"   Search Pattern: {', '.join(patterns)}")
+    for i, (file, data) in enumerate(iter_saved_wallets('.'), 1):
+        print(f"\n{i}. File: {file}")
+        print(f"   Public Key: {data.get('public_key', '?')}")
+        if show_private:
+            print(f"   Private Key: {data.get('secret_key', '?')}")
+        
+        # Display search patterns if they exist in the file
+        patterns = format_search_patterns(data)
+        if patterns:
+            print(f"   Search Pattern: {patterns}")
     
     input("\nPress Enter to continue...")
 
@@ -473,4 +1687,28 @@ def print_system_info():
     print("Note: Using all cores may impact system performance")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Solana vanity address generator")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-stage worker timings to PATH (JSON) and a .trace.json file")
+    parser.add_argument("--profile-rate", type=float, default=0.001,
+                        help="fraction of attempts to time when profiling (default: 0.001)")
+    parser.add_argument("--master-seed-file", metavar="PATH",
+                        help="read the hex job seed for a sharded, reproducible run from PATH ('-' to type it); "
+                             f"defaults to ${MASTER_SEED_ENV}. The seed regenerates every key found, keep it secret")
+    parser.add_argument("--node-id", type=int, default=0,
+                        help="this machine's index within a sharded job (default: 0)")
+    parser.add_argument("--counter-start", type=int, default=0,
+                        help="first keystream counter for every shard, to resume a sharded job")
+    args = parser.parse_args()
+    if args.profile and not 0 < args.profile_rate <= 1:
+        parser.error("--profile-rate must be greater than 0 and at most 1")
+    if not 0 <= args.node_id < 2 ** (64 - SHARD_WORKER_BITS):
+        parser.error(f"--node-id must be between 0 and 2**{64 - SHARD_WORKER_BITS} - 1")
+    if not 0 <= args.counter_start < 2 ** 64:
+        parser.error("--counter-start must be between 0 and 2**64 - 1")
+    try:
+        master_seed = load_master_seed(args.master_seed_file)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    main(profile_path=args.profile, profile_rate=args.profile_rate,
+         master_seed=master_seed, node_id=args.node_id, counter_start=args.counter_start) 
\ No newline at end of file
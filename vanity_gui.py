@@ -1,14 +1,193 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import os
 import time
 from datetime import timedelta
 import psutil
-from solana_vanity import VanityAddressGenerator
+from solana_vanity import (VanityAddressGenerator, DEFAULT_CORE_SPEED, ResultSink, analyze_pattern,
+                           calibrate_throughput, check_budget, format_duration, format_search_patterns, iter_saved_wallets,
+                           list_wallet_files, success_probability)
 import threading
 import queue
-import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+class WalletViewer:
+    """Paged view over the saved wallets, indexed by a background loader"""
+    PAGE_SIZE = 100
+    BATCH_SIZE = 500
+
+    def __init__(self, root):
+        self.records = []  # (file, public key, secret key, patterns, pattern/file search text)
+        self.filtered = []  # Indices into records matching the current filter
+        self.page = 0
+        self.query = ""
+        self.key_query = ""
+        self.loading = True
+        self.load_queue = queue.Queue()
+        self.stop_loading = threading.Event()
+        self.filter_job = None
+        
+        # Create viewer window
+        self.window = tk.Toplevel(root)
+        self.window.title("Saved Addresses")
+        self.window.geometry("700x450")
+        self.window.transient(root)  # Make window modal
+        self.window.grab_set()  # Make window modal
+        self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        self.search_var = tk.StringVar()
+        self.show_private = tk.BooleanVar(value=False)
+        self.page_var = tk.StringVar()
+        
+        self.create_widgets()
+        self.search_var.trace_add("write", self.schedule_filter)
+        self.show_private.trace_add("write", self.toggle_private)
+        
+        threading.Thread(target=self.load_wallets, daemon=True).start()
+        self.poll_loader()
+
+    def create_widgets(self):
+        frame = ttk.Frame(self.window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Search box and show private key toggle with warning
+        top_frame = ttk.Frame(frame)
+        top_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Label(top_frame, text="Search:").pack(side=tk.LEFT)
+        ttk.Entry(top_frame, textvariable=self.search_var, width=25).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(top_frame, text="Show Private Keys",
+                       variable=self.show_private).pack(side=tk.LEFT, padx=5)
+        self.warning_label = ttk.Label(top_frame,
+                                     text="Warning: Never share private keys!",
+                                     foreground="red")
+        
+        # Only one page of rows ever lives in the tree
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("index", "public_key", "patterns", "secret_key", "file")
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings",
+                                 height=self.PAGE_SIZE // 5)
+        for column, heading, width in (("index", "#", 50), ("public_key", "Public Key", 330),
+                                       ("patterns", "Search Pattern", 160),
+                                       ("secret_key", "Private Key", 330), ("file", "File", 200)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, stretch=column != "index")
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.config(yscrollcommand=scrollbar.set)
+        self.update_columns()
+        
+        # Paging controls
+        nav_frame = ttk.Frame(frame)
+        nav_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(nav_frame, text="< Prev", command=lambda: self.change_page(-1)).pack(side=tk.LEFT)
+        ttk.Button(nav_frame, text="Next >", command=lambda: self.change_page(1)).pack(side=tk.LEFT, padx=5)
+        ttk.Label(nav_frame, textvariable=self.page_var).pack(side=tk.LEFT, padx=5)
+
+    def load_wallets(self):
+        """Read wallet files off the Tk thread and hand them over in batches"""
+        batch = []
+        try:
+            for file, data in iter_saved_wallets('.'):
+                if self.stop_loading.is_set():
+                    return
+                patterns = format_search_patterns(data)
+                public_key = str(data.get('public_key', ''))
+                batch.append((file, public_key, str(data.get('secret_key', '')), patterns,
+                              f"{patterns}\n{file}".lower()))
+                if len(batch) >= self.BATCH_SIZE:
+                    self.load_queue.put(batch)
+                    batch = []
+            self.load_queue.put(batch)
+        finally:
+            self.load_queue.put(None)  # Loading finished, even if a record was unusable
+
+    def poll_loader(self):
+        if self.stop_loading.is_set():
+            return
+        changed = False
+        try:
+            while True:
+                batch = self.load_queue.get_nowait()
+                if batch is None:
+                    self.loading = False
+                    changed = True
+                    break
+                start = len(self.records)
+                self.records.extend(batch)
+                self.filtered.extend(i for i in range(start, len(self.records))
+                                     if self.matches(self.records[i]))
+                changed = True
+        except queue.Empty:
+            pass
+        if changed:
+            self.render()
+        if self.loading:
+            self.window.after(100, self.poll_loader)
+
+    def matches(self, record):
+        # Public keys match by prefix; patterns and file names by substring
+        return (not self.query or record[1].startswith(self.key_query)
+                or self.query in record[4])
+
+    def schedule_filter(self, *args):
+        # Debounce so typing doesn't rescan the index on every keystroke
+        if self.filter_job:
+            self.window.after_cancel(self.filter_job)
+        self.filter_job = self.window.after(200, self.apply_filter)
+
+    def apply_filter(self):
+        self.filter_job = None
+        self.key_query = self.search_var.get().strip()
+        self.query = self.key_query.lower()
+        self.filtered = [i for i, record in enumerate(self.records) if self.matches(record)]
+        self.page = 0
+        self.render()
+
+    def change_page(self, delta):
+        last_page = max(0, (len(self.filtered) - 1) // self.PAGE_SIZE)
+        page = min(max(0, self.page + delta), last_page)
+        if page != self.page:
+            self.page = page
+            self.render()
+
+    def update_columns(self):
+        if self.show_private.get():
+            self.warning_label.pack(side=tk.LEFT, padx=10)  # Show warning
+            self.tree.config(displaycolumns=("index", "public_key", "secret_key", "patterns"))
+        else:
+            self.warning_label.pack_forget()  # Hide warning
+            self.tree.config(displaycolumns=("index", "public_key", "patterns", "file"))
+
+    def toggle_private(self, *args):
+        # Secrets are already in the index, so this is only a re-render
+        self.update_columns()
+        self.render()
+
+    def render(self):
+        self.tree.delete(*self.tree.get_children())
+        show_private = self.show_private.get()
+        start = self.page * self.PAGE_SIZE
+        for i in self.filtered[start:start + self.PAGE_SIZE]:
+            file, public_key, secret_key, patterns, _ = self.records[i]
+            self.tree.insert("", tk.END, values=(i + 1, public_key, patterns,
+                                                 secret_key if show_private else "", file))
+        
+        pages = max(1, (len(self.filtered) + self.PAGE_SIZE - 1) // self.PAGE_SIZE)
+        status = f"Page {self.page + 1} of {pages} | {len(self.filtered):,} of {len(self.records):,} wallets"
+        if self.loading:
+            status += " (loading...)"
+        self.page_var.set(status)
+
+    def on_closing(self):
+        self.stop_loading.set()
+        if self.filter_job:
+            self.window.after_cancel(self.filter_job)
+        self.window.grab_release()
+        self.window.destroy()
 
 class VanityGUI:
     def __init__(self):
@@ -21,6 +200,7 @@ class VanityGUI:
         self.suffix_var = tk.StringVar()
         self.case_sensitive = tk.BooleanVar(value=True)
         self.cores_var = tk.StringVar(value=str(max(1, psutil.cpu_count() - 1)))
+        self.time_limit_var = tk.StringVar()  # Minutes; blank for no limit
         self.status_var = tk.StringVar(value="Ready")
         self.progress_var = tk.StringVar()
         
@@ -29,6 +209,14 @@ class VanityGUI:
         self.is_running = False
         self.is_paused = False
         self.update_queue = queue.Queue()
+        self.result_sink = ResultSink()
+        
+        # Pattern analysis runs off the Tk thread; only the newest request is shown
+        self.analysis_executor = ThreadPoolExecutor(max_workers=1)
+        self.analysis_job = None
+        self.analysis_key = None
+        self.core_speed = DEFAULT_CORE_SPEED
+        self.analysis_var = tk.StringVar()
         
         # Set up close protocol
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -36,6 +224,11 @@ class VanityGUI:
         self.create_gui()
         self.update_status()
         
+        for var in (self.prefix_var, self.suffix_var, self.case_sensitive, self.cores_var, self.time_limit_var):
+            var.trace_add("write", self.schedule_analysis)
+        self.analysis_executor.submit(self.calibrate)
+        self.schedule_analysis()
+        
     def create_gui(self):
         # Main frame with padding
         main_frame = ttk.Frame(self.root, padding="10")
@@ -95,9 +288,26 @@ class VanityGUI:
                                textvariable=self.cores_var, width=5)
         cores_spin.grid(row=0, column=2, padx=5)
         
+        ttk.Label(options_frame, text="Time Limit (min):").grid(row=0, column=3, padx=5)
+        ttk.Entry(options_frame, textvariable=self.time_limit_var, width=6).grid(row=0, column=4, padx=5)
+        
+        # Analysis Frame
+        analysis_frame = ttk.LabelFrame(main_frame, text="Pattern Analysis", padding="5")
+        analysis_frame.grid(row=4, column=0, columnspan=2, sticky=tk.EW, pady=(0, 5))
+        
+        # Echo of the pattern with invalid characters highlighted
+        self.pattern_text = tk.Text(analysis_frame, height=1, width=50, relief=tk.FLAT,
+                                    font=('Courier', 10), background=self.root.cget('background'))
+        self.pattern_text.tag_configure("invalid", foreground="white", background="red")
+        self.pattern_text.tag_configure("wildcard", foreground="gray")
+        self.pattern_text.config(state=tk.DISABLED)
+        self.pattern_text.pack(fill=tk.X)
+        ttk.Label(analysis_frame, textvariable=self.analysis_var, justify=tk.LEFT,
+                 wraplength=400).pack(fill=tk.X)
+        
         # Buttons Frame
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=5)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=5)
         
         self.start_button = ttk.Button(button_frame, text="Start", 
                                      command=self.start_generation)
@@ -118,7 +328,7 @@ class VanityGUI:
         
         # Progress Frame
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="5")
-        progress_frame.grid(row=5, column=0, columnspan=2, sticky=tk.EW, pady=(0, 5))
+        progress_frame.grid(row=6, column=0, columnspan=2, sticky=tk.EW, pady=(0, 5))
         
         self.progress_label = ttk.Label(progress_frame, textvariable=self.progress_var,
                                       wraplength=400)
@@ -141,12 +351,94 @@ class VanityGUI:
                     self.status_var.set(msg['status'])
                 if 'progress' in msg:
                     self.progress_var.set(msg['progress'])
+                if 'analysis' in msg:
+                    self.show_analysis(*msg['analysis'])
                 if 'complete' in msg:
                     self.generation_complete()
         except queue.Empty:
             pass
         self.root.after(100, self.update_status)
 
+    def calibrate(self):
+        self.core_speed = calibrate_throughput()
+        self.update_queue.put({'analysis': (None, None)})  # Refresh with the measured speed
+
+    def schedule_analysis(self, *args):
+        # Debounce so a burst of keystrokes triggers a single analysis
+        if self.analysis_job:
+            self.root.after_cancel(self.analysis_job)
+        self.analysis_job = self.root.after(250, self.request_analysis)
+
+    def time_limit(self):
+        """Time limit in seconds, None for no limit; raises ValueError when malformed"""
+        text = self.time_limit_var.get().strip()
+        if not text:
+            return None
+        seconds = float(text) * 60
+        check_budget(seconds)  # Also rejects nan and inf
+        return seconds
+
+    def request_analysis(self):
+        self.analysis_job = None
+        try:
+            cores = int(self.cores_var.get())
+        except (ValueError, tk.TclError):
+            cores = 0
+        # Round the speed so small calibration changes still hit the cache
+        speed = float(f"{self.core_speed:.3g}")
+        key = (self.prefix_var.get().strip(), self.suffix_var.get().strip(),
+               self.case_sensitive.get(), cores, speed)
+        self.analysis_key = key
+        if cores < 1:
+            self.show_analysis(key, None)
+            return
+        future = self.analysis_executor.submit(analyze_pattern, *key)
+        future.add_done_callback(lambda f: self.update_queue.put({'analysis': (key, f.result())}))
+
+    def show_analysis(self, key, analysis):
+        if key is None:
+            self.schedule_analysis()
+            return
+        if key != self.analysis_key:
+            return  # A newer request is pending
+        prefix, suffix, case_sensitive, cores, speed = key
+        
+        invalid = {(field, i) for field, i, _ in analysis.invalid_chars} if analysis else set()
+        self.pattern_text.config(state=tk.NORMAL)
+        self.pattern_text.delete(1.0, tk.END)
+        for i, char in enumerate(prefix):
+            self.pattern_text.insert(tk.END, char, ("invalid",) if ("prefix", i) in invalid else ())
+        if prefix or suffix:
+            self.pattern_text.insert(tk.END, "...", ("wildcard",))
+        for i, char in enumerate(suffix):
+            self.pattern_text.insert(tk.END, char, ("invalid",) if ("suffix", i) in invalid else ())
+        self.pattern_text.config(state=tk.DISABLED)
+        
+        if cores < 1:
+            self.analysis_var.set(f"Cores must be between 1 and {psutil.cpu_count()}")
+        elif not prefix and not suffix:
+            self.analysis_var.set("Enter a prefix and/or suffix")
+        elif analysis.invalid_chars:
+            chars = ", ".join(f"'{char}'" for _, _, char in analysis.invalid_chars)
+            self.analysis_var.set(f"Invalid: {chars} not in Base58 (no 0, O, I or l)")
+        else:
+            try:
+                limit = self.time_limit()
+                odds = "" if limit is None else (
+                    f"\nChance within {format_duration(limit)}: "
+                    f"{success_probability(analysis.probability, limit * analysis.speed):.1%}")
+            except ValueError:
+                odds = "\nTime limit must be a positive number of minutes"
+            self.analysis_var.set(
+                f"Valid | 1 in {analysis.expected_attempts:,.0f} addresses "
+                f"at ~{analysis.speed:,.0f} addr/s\n"
+                f"Expected: {format_duration(analysis.expected_seconds)} | "
+                f"50%: {format_duration(analysis.eta_p50)} | "
+                f"90%: {format_duration(analysis.eta_p90)} | "
+                f"99%: {format_duration(analysis.eta_p99)}"
+                f"{odds}"
+            )
+
     def start_generation(self):
         if self.is_running:
             return
@@ -166,26 +458,27 @@ class VanityGUI:
             messagebox.showerror("Error", f"Cores must be between 1 and {psutil.cpu_count()}")
             return
             
-        # Calculate estimate
-        est_seconds, combinations = VanityAddressGenerator.estimate_time(prefix, suffix, cores)
-        
-        msg = f"Pattern Analysis:\n\n"
-        if prefix:
-            msg += f"Prefix: '{prefix}'\n"
-        if suffix:
-            msg += f"Suffix: '{suffix}'\n"
-        msg += f"Total combinations: {combinations:,}\n"
-        msg += f"Estimated time: {timedelta(seconds=int(est_seconds))}\n\n"
-        
-        if est_seconds > 3600:
-            msg += "Warning: This might take a long time!\n"
-            msg += "Consider using a shorter pattern or more cores.\n\n"
+        try:
+            max_seconds = self.time_limit()
+        except ValueError:
+            messagebox.showerror("Error", "Time limit must be a positive number of minutes")
+            return
             
-        msg += "Do you want to proceed?"
-        
-        if not messagebox.askyesno("Confirm Generation", msg):
+        # The analysis panel already shows the numbers; only stop for bad or slow patterns
+        analysis = analyze_pattern(prefix, suffix, self.case_sensitive.get(), cores,
+                                   float(f"{self.core_speed:.3g}"))
+        if not analysis.valid:
+            messagebox.showerror("Error", "Invalid pattern! Only Base58 characters are allowed.")
             return
             
+        if analysis.eta_p50 > 3600 and max_seconds is None:
+            msg = (f"Half of all searches for this pattern take longer than "
+                   f"{format_duration(analysis.eta_p50)}.\n\n"
+                   "Consider using a shorter pattern or more cores.\n\n"
+                   "Do you want to proceed?")
+            if not messagebox.askyesno("Confirm Generation", msg):
+                return
+            
         # Start generation
         self.is_running = True
         self.generator = VanityAddressGenerator(prefix, suffix, self.case_sensitive.get())
@@ -198,9 +491,12 @@ class VanityGUI:
         
         # Start generation thread
         threading.Thread(target=self.generation_thread, 
-                       args=(cores,), daemon=True).start()
+                       args=(self.generator, cores, max_seconds), daemon=True).start()
 
-    def generation_thread(self, cores):
+    def generation_thread(self, generator, cores, max_seconds=None):
+        # Only this run's generator is used here: Start may create a new one as soon as
+        # this thread posts 'complete', and that must be the last thing it does
+        stop_monitor = threading.Event()
         try:
             self.update_queue.put({
                 'status': 'Running',
@@ -208,98 +504,124 @@ class VanityGUI:
             })
             
             # Start monitoring thread for real-time updates
-            stop_monitor = threading.Event()
             monitor_thread = threading.Thread(
                 target=self.monitor_progress,
-                args=(cores, stop_monitor),
+                args=(generator, stop_monitor),
                 daemon=True
             )
             monitor_thread.start()
             
-            try:
-                keypair, attempts, elapsed = self.generator.generate(cores)
-                stop_monitor.set()  # Stop the monitoring thread
-                
-                if keypair:  # If not cancelled
+            keypair, attempts, elapsed = generator.generate(cores, max_seconds)
+            stop_monitor.set()  # Stop the monitoring thread
+            if generator.speed_stats.count:
+                # A real run is a better calibration than the startup benchmark
+                self.core_speed = generator.speed_stats.average_rate
+            
+            if keypair:  # If not cancelled
+                extra = {"case_sensitive": generator.case_sensitive}
+                record = VanityAddressGenerator.wallet_record(
+                    keypair,
+                    generator.prefix,
+                    generator.suffix,
+                    **extra
+                )
+                try:
+                    # Wait for the commit so "Saved" is only shown once it's on disk
+                    self.result_sink.submit(record)
+                    try:
+                        self.result_sink.flush(timeout=10)
+                    except TimeoutError:
+                        # Already queued, so keep waiting rather than saving it twice
+                        self.update_queue.put({
+                            'status': 'Saving...',
+                            'progress': "Waiting for the disk to confirm the save..."
+                        })
+                        self.result_sink.flush()
+                    filename = self.result_sink.current_path
+                except RuntimeError:
                     filename = f"vanity-wallet-{int(time.time())}.json"
                     VanityAddressGenerator.save_to_file(
                         keypair, filename,
-                        self.prefix_var.get().strip(),
-                        self.suffix_var.get().strip()
+                        generator.prefix,
+                        generator.suffix,
+                        **extra
                     )
-                    
-                    self.update_queue.put({
-                        'status': 'Complete!',
-                        'progress': f"Found matching address!\n"
-                                   f"Public Key: {keypair.pubkey()}\n"
-                                   f"Attempts: {attempts:,}\n"
-                                   f"Time: {timedelta(seconds=int(elapsed))}\n"
-                                   f"Saved to: {filename}"
-                    })
                 
-                self.update_queue.put({'complete': True})
-                
-            except Exception as e:
-                stop_monitor.set()  # Stop the monitoring thread
+                self.update_queue.put({
+                    'status': 'Complete!',
+                    'progress': f"Found matching address!\n"
+                               f"Public Key: {keypair.pubkey()}\n"
+                               f"Attempts: {attempts:,}\n"
+                               f"Time: {timedelta(seconds=int(elapsed))}\n"
+                               f"Saved to: {filename}"
+                })
+            elif generator.stop_reason and generator.stop_reason.endswith("budget reached"):
+                odds = success_probability(generator.probability, attempts)
+                self.update_queue.put({
+                    'status': 'Time limit reached',
+                    'progress': f"No match within the time limit\n"
+                               f"Attempts: {attempts:,}\n"
+                               f"Time: {timedelta(seconds=int(elapsed))}\n"
+                               f"Odds of a match with that much work were {odds:.1%}"
+                })
+            elif generator.stop_reason == "stopped":
+                self.update_queue.put({
+                    'status': 'Stopped',
+                    'progress': f"Generation stopped by user\n"
+                               f"Attempts: {attempts:,}"
+                })
+            else:
+                # Anything else means the run never got going or died, e.g. a rejected pattern
+                reason = generator.stop_reason or "generation ended without a result"
                 self.update_queue.put({
                     'status': 'Error occurred',
-                    'progress': f"Error: {str(e)}"
+                    'progress': f"Error: {reason}"
                 })
-                self.update_queue.put({'complete': True})
-                
+            
         except Exception as e:
             self.update_queue.put({
                 'status': 'Error occurred',
                 'progress': f"Error: {str(e)}"
             })
+        finally:
+            stop_monitor.set()
             self.update_queue.put({'complete': True})
 
-    def monitor_progress(self, cores, stop_event):
+    def monitor_progress(self, generator, stop_event):
         """Monitor and update progress in real-time"""
-        start_time = time.time()
-        last_update = 0
-        
         while not stop_event.is_set():
-            if self.generator and hasattr(self.generator, 'attempts_per_sec') and self.generator.attempts_per_sec:
-                current_time = time.time()
-                
-                # Update every 0.5 seconds
-                if current_time - last_update >= 0.5:
-                    # Calculate statistics
-                    elapsed = current_time - start_time
-                    avg_speed = sum(self.generator.attempts_per_sec) / len(self.generator.attempts_per_sec)
-                    if len(self.generator.attempts_per_sec) > 1:
-                        recent_speed = statistics.mean(self.generator.attempts_per_sec[-10:])
-                    else:
-                        recent_speed = avg_speed
-                    
-                    # Calculate remaining time
-                    prefix = self.prefix_var.get().strip()
-                    suffix = self.suffix_var.get().strip()
-                    possible_combinations = 58 ** len(prefix + suffix)
-                    estimated_total_attempts = possible_combinations / 2
-                    total_attempts = sum(self.generator.attempts_per_sec)
-                    remaining_attempts = max(0, estimated_total_attempts - total_attempts)
-                    time_remaining = remaining_attempts / (recent_speed * cores)
-                    
-                    # Update status
-                    status = "Running"
-                    if self.is_paused:
-                        status = "Paused"
-                    
-                    self.update_queue.put({
-                        'status': status,
-                        'progress': (
-                            f"Speed: {recent_speed * cores:,.0f} addr/s\n"
-                            f"Total Attempts: {total_attempts:,}\n"
-                            f"Elapsed Time: {timedelta(seconds=int(elapsed))}\n"
-                            f"Estimated Remaining: {timedelta(seconds=int(time_remaining))}"
-                        )
-                    })
-                    
-                    last_update = current_time
+            progress = generator.progress()
+            if progress and progress.worker_rates:
+                workers = len(progress.worker_rates)
+                per_worker = progress.total_rate / workers
+                status = "Paused" if progress.paused else "Running"
+                health = ""
+                if progress.degraded:
+                    status += " (degraded)"
+                    health = (f"\nWarning: only {progress.live_workers} of {progress.expected_workers} "
+                              f"workers running, throughput reduced")
+                elif progress.restarts:
+                    health = f"\nWorker restarts: {progress.restarts}"
+                budget = ""
+                if progress.success_within_budget is not None:
+                    budget = f"\nChance Within Time Limit: {progress.success_within_budget:.1%}"
+                self.update_queue.put({
+                    'status': status,
+                    'progress': (
+                        f"Speed: {progress.total_rate:,.0f} addr/s "
+                        f"({workers} workers, ~{per_worker:,.0f} each)\n"
+                        f"Total Attempts: {progress.total_attempts:,}\n"
+                        f"Elapsed Time: {timedelta(seconds=int(progress.elapsed))}\n"
+                        f"Chance Found By Now: {progress.match_probability:.1%}\n"
+                        f"Expected Remaining: {format_duration(progress.eta_seconds)} "
+                        f"(~{progress.expected_attempts:,.0f} attempts)\n"
+                        f"50% / 90% Chance Within: {format_duration(progress.eta_p50)} / "
+                        f"{format_duration(progress.eta_p90)}"
+                        f"{budget}{health}"
+                    )
+                })
             
-            time.sleep(0.1)  # Prevent high CPU usage
+            time.sleep(0.5)  # Sampling the generator is cheap; no need to poll faster
 
     def toggle_pause(self):
         if not self.generator:
@@ -320,12 +642,10 @@ class VanityGUI:
             return
             
         if messagebox.askyesno("Confirm", "Stop the generation process?"):
+            # The generation thread reports the outcome and re-enables Start once generate() returns
+            self.pause_button.config(state=tk.DISABLED)
+            self.stop_button.config(state=tk.DISABLED)
             self.cleanup()
-            self.update_queue.put({
-                'status': 'Stopped',
-                'progress': "Generation stopped by user",
-                'complete': True
-            })
 
     def generation_complete(self):
         self.is_running = False
@@ -336,96 +656,29 @@ class VanityGUI:
         self.view_button.config(state=tk.NORMAL)
 
     def view_saved(self):
-        wallet_files = [f for f in os.listdir('.')
-                       if f.startswith('vanity-wallet-') and f.endswith('.json')]
-        
-        if not wallet_files:
+        if next(list_wallet_files('.'), None) is None:
             messagebox.showinfo("Info", "No saved addresses found!")
             return
             
-        # Create viewer window
-        viewer = tk.Toplevel(self.root)
-        viewer.title("Saved Addresses")
-        viewer.geometry("500x400")
-        viewer.transient(self.root)  # Make window modal
-        viewer.grab_set()  # Make window modal
-        
-        # Set up close protocol for viewer window
-        def on_viewer_closing():
-            viewer.grab_release()
-            viewer.destroy()
-        
-        viewer.protocol("WM_DELETE_WINDOW", on_viewer_closing)
-        
-        frame = ttk.Frame(viewer, padding="10")
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Add show private key toggle with warning
-        show_frame = ttk.Frame(frame)
-        show_frame.pack(fill=tk.X, pady=(0, 5))
-        
-        show_private = tk.BooleanVar(value=False)
-        ttk.Checkbutton(show_frame, text="Show Private Keys", 
-                       variable=show_private).pack(side=tk.LEFT)
-        warning_label = ttk.Label(show_frame, 
-                                text="Warning: Never share private keys!",
-                                foreground="red")
-        warning_label.pack(side=tk.LEFT, padx=10)
-        warning_label.pack_forget()  # Initially hidden
-        
-        # Create text widget
-        text = tk.Text(frame, wrap=tk.WORD, height=20)
-        text.pack(fill=tk.BOTH, expand=True)
-        text.config(state=tk.DISABLED)  # Make read-only
-        
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        text.config(yscrollcommand=scrollbar.set)
-        
-        def update_view(*args):
-            text.config(state=tk.NORMAL)  # Allow editing
-            text.delete(1.0, tk.END)
-            
-            if show_private.get():
-                warning_label.pack(side=tk.LEFT, padx=10)  # Show warning
-            else:
-                warning_label.pack_forget()  # Hide warning
-            
-            for i, file in enumerate(wallet_files, 1):
-                with open(file) as f:
-                    data = json.load(f)
-                    text.insert(tk.END, f"\n{i}. File: {file}\n")
-                    text.insert(tk.END, f"   Public Key: {data['public_key']}\n")
-                    if show_private.get():
-                        text.insert(tk.END, f"   Private Key: {data['secret_key']}\n")
-                    if "search_patterns" in data:
-                        patterns = []
-                        if data["search_patterns"]["prefix"]:
-                            patterns.append(f"prefix='{data['search_patterns']['prefix']}'")
-                        if data["search_patterns"]["suffix"]:
-                            patterns.append(f"suffix='{data['search_patterns']['suffix']}'")
-                        if patterns:
-                            text.insert(tk.END, f"   Search Pattern: {', '.join(patterns)}\n")
-            text.see(1.0)
-            text.config(state=tk.DISABLED)  # Make read-only again
-        
-        update_view()  # Initial view
-        show_private.trace_add("write", update_view)  # Modern way to trace variable changes
+        WalletViewer(self.root)
 
     def on_closing(self):
         """Handle window close event"""
         if self.is_running:
-            if messagebox.askyesno("Quit", "Generation is in progress. Are you sure you want to quit?"):
-                self.cleanup()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askyesno("Quit", "Generation is in progress. Are you sure you want to quit?"):
+                return
+            self.cleanup()
+        self.analysis_executor.shutdown(wait=False)
+        try:
+            self.result_sink.close(timeout=10)
+        except RuntimeError:
+            pass  # Anything unsaved was already written to a fallback file
+        self.root.destroy()
 
     def cleanup(self):
         """Clean up resources before closing"""
         if self.generator:
-            self.generator.pause_event.set()  # Pause any running processes
+            self.generator.stop()  # Workers wind down before generate() returns
             # Wait briefly for processes to clean up
             self.update_queue.put({
                 'status': 'Stopping...',